@@ -2,17 +2,30 @@
 import math
 import random
 import sys
+from collections import namedtuple
+from itertools import chain
+import numpy as np
 import pygame
 from pygame import Vector2
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the kernels are valid NumPy as well
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 # ---------- Configuration ----------
 WIDTH, HEIGHT = 900, 600
 FPS = 60
+IDLE_FPS = 15  # while the window is minimized / hidden
 
 # Player settings
 PLAYER_SPEED = 340        # pixels per second
 PLAYER_SIZE = (48, 36)
 PLAYER_FIRE_COOLDOWN = 0.18  # seconds
+PLAYER_MAX_TILT = 12  # degrees
 
 # Bullet settings
 BULLET_SPEED = 700
@@ -23,11 +36,16 @@ ENEMY_SPEED_MIN = 60
 ENEMY_SPEED_MAX = 140
 ENEMY_SPAWN_INTERVAL = 1.0  # seconds
 ENEMY_SIZE = (42, 30)
+ENEMY_WOBBLE_SPEED = 4.0  # radians per second
 
 # Particle settings (for explosions)
 PARTICLE_COUNT = 18
 PARTICLE_SPEED = 180
 PARTICLE_LIFETIME = 0.6
+PARTICLE_ALPHA_LEVELS = 8
+
+# Collision grid (cells must be larger than any sprite)
+CELL_SIZE = 64
 
 # Colors (pleasant pastel palette)
 PALETTE = {
@@ -52,11 +70,44 @@ clock = pygame.time.Clock()
 font = pygame.font.Font(None, 28)
 
 
+# Key bindings (bound once so the frame loop avoids pygame attribute lookups)
+_K_LEFT, _K_A = pygame.K_LEFT, pygame.K_a
+_K_RIGHT, _K_D = pygame.K_RIGHT, pygame.K_d
+_K_UP, _K_W = pygame.K_UP, pygame.K_w
+_K_DOWN, _K_S = pygame.K_DOWN, pygame.K_s
+_K_SPACE, _K_Z = pygame.K_SPACE, pygame.K_z
+
+# held directions/fire for one frame
+Controls = namedtuple("Controls", "left right up down fire")
+
+
+def read_controls():
+    keys = pygame.key.get_pressed()
+    return Controls(
+        left=keys[_K_LEFT] or keys[_K_A],
+        right=keys[_K_RIGHT] or keys[_K_D],
+        up=keys[_K_UP] or keys[_K_W],
+        down=keys[_K_DOWN] or keys[_K_S],
+        fire=keys[_K_SPACE] or keys[_K_Z],
+    )
+
+
 # ---------- Utilities ----------
 def clamp(v, a, b):
     return max(a, min(b, v))
 
 
+# sine lookup table (power of two so the index can wrap with a mask);
+# kept as a list because indexing a NumPy array per scalar is slower than math.sin
+SIN_LUT_SIZE = 4096
+SIN_LUT = np.sin(np.linspace(0, math.tau, SIN_LUT_SIZE, endpoint=False)).tolist()
+SIN_LUT_SCALE = SIN_LUT_SIZE / math.tau
+
+
+def fast_sin(angle):
+    return SIN_LUT[int(angle * SIN_LUT_SCALE) & (SIN_LUT_SIZE - 1)]
+
+
 # ---------- Visual Helpers ----------
 def rounded_rect(surface, rect, color, radius=6):
     """Draw a rounded rect on surface (helpful for UI)"""
@@ -69,13 +120,27 @@ def rounded_rect(surface, rect, color, radius=6):
     pygame.draw.circle(surface, color, (x + w - radius, y + h - radius), radius)
 
 
+def make_gradient(h, w, c0, c1):
+    """Vertical gradient as an (h, w, 3) uint8 array."""
+    c0 = np.array(c0, np.float64)
+    c1 = np.array(c1, np.float64)
+    t = np.arange(h, dtype=np.float64)[:, None] / h
+    rgb = (c0 * (1 - t) + c1 * t).astype(np.uint8)
+    return np.broadcast_to(rgb[:, None, :], (h, w, 3))
+
+
 # ---------- Sprites ----------
 class Player(pygame.sprite.Sprite):
     def __init__(self, pos):
         super().__init__()
         self.base_image = self.make_image()
-        self.image = self.base_image
-        self.rect = self.image.get_rect(center=pos)
+        # pre-rotated frames for every whole degree of tilt
+        self.tilt_frames = [pygame.transform.rotozoom(self.base_image, a, 1.0).convert_alpha()
+                            for a in range(-PLAYER_MAX_TILT, PLAYER_MAX_TILT + 1)]
+        self.tilt_idx = PLAYER_MAX_TILT  # level flight
+        self.image = self.tilt_frames[self.tilt_idx]
+        self.rect = self.base_image.get_rect(center=pos)
+        self.radius = min(PLAYER_SIZE) // 2  # for collide_circle
         self.pos = Vector2(pos)
         self.vel = Vector2(0, 0)
         self.fire_timer = 0.0
@@ -94,18 +159,18 @@ class Player(pygame.sprite.Sprite):
         )
         # cockpit
         pygame.draw.ellipse(surf, PALETTE["player_shade"], (w * 0.35, h * 0.15, w * 0.3, h * 0.28))
-        return surf
+        return surf.convert_alpha()
 
-    def update(self, dt, keys):
+    def update(self, dt, controls):
         # Movement input
         move = Vector2(0, 0)
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if controls.left:
             move.x -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if controls.right:
             move.x += 1
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if controls.up:
             move.y -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if controls.down:
             move.y += 1
         if move.length_squared() > 0:
             move = move.normalize()
@@ -117,8 +182,11 @@ class Player(pygame.sprite.Sprite):
         self.rect.center = self.pos
 
         # tilt effect
-        tilt = -self.vel.x / PLAYER_SPEED * 12  # degrees
-        self.image = pygame.transform.rotozoom(self.base_image, tilt, 1.0)
+        tilt = -self.vel.x / PLAYER_SPEED * PLAYER_MAX_TILT  # degrees
+        tilt_idx = int(round(tilt)) + PLAYER_MAX_TILT
+        if tilt_idx != self.tilt_idx:
+            self.tilt_idx = tilt_idx
+            self.image = self.tilt_frames[tilt_idx]
 
         # fire timer
         self.fire_timer = max(0.0, self.fire_timer - dt)
@@ -130,112 +198,284 @@ class Player(pygame.sprite.Sprite):
         self.fire_timer = PLAYER_FIRE_COOLDOWN
 
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, pos):
-        super().__init__()
+class ArrayPool:
+    """Growable parallel arrays; rows [0, n) are live.
+
+    Buffers are allocated once (doubling if they ever fill up) and reused, so
+    spawning never reallocates them. Removing rows still builds a small
+    temporary per field (see keep).
+    """
+
+    def __init__(self, capacity, **fields):
+        # fields: name -> (per-row shape, dtype)
+        self.n = 0
+        self.fields = tuple(fields)
+        for name, (shape, dtype) in fields.items():
+            setattr(self, name, np.zeros((capacity,) + shape, dtype))
+
+    def __len__(self):
+        return self.n
+
+    def acquire(self, count=1):
+        """Reserve count rows at the end and return their slice."""
+        start, end = self.n, self.n + count
+        capacity = len(getattr(self, self.fields[0]))
+        if end > capacity:
+            capacity = max(end, capacity * 2)
+            for name in self.fields:
+                old = getattr(self, name)
+                new = np.zeros((capacity,) + old.shape[1:], old.dtype)
+                new[:start] = old[:start]
+                setattr(self, name, new)
+        self.n = end
+        return slice(start, end)
+
+    def keep(self, mask):
+        """Move rows where mask (length n) is true to the front; drop the rest."""
+        if mask.all():
+            return
+        n = self.n
+        self.n = int(mask.sum())
+        for name in self.fields:
+            arr = getattr(self, name)
+            arr[:self.n] = arr[:n][mask]
+
+    def release(self, indices):
+        mask = np.ones(self.n, bool)
+        mask[indices] = False
+        self.keep(mask)
+
+    def clear(self):
+        self.n = 0
+
+
+class BulletPool(ArrayPool):
+    """All live bullets as parallel arrays; Rects are only built for drawing/collision."""
+
+    def __init__(self, capacity=64):
+        super().__init__(capacity, xs=((), np.float32), ys=((), np.float32), vys=((), np.float32))
         self.image = pygame.Surface(BULLET_SIZE, pygame.SRCALPHA)
         # soft rounded bullet
         pygame.draw.rect(self.image, PALETTE["bullet"], self.image.get_rect(), border_radius=4)
-        self.rect = self.image.get_rect(center=pos)
-        self.pos = Vector2(pos)
-        self.vel = Vector2(0, -BULLET_SPEED)
+        self.image = self.image.convert_alpha()
+
+    def spawn(self, pos):
+        i = self.acquire().start
+        self.xs[i], self.ys[i] = pos
+        self.vys[i] = -BULLET_SPEED
 
     def update(self, dt):
-        self.pos += self.vel * dt
-        self.rect.center = self.pos
-        if self.rect.bottom < -20:
-            self.kill()
+        n = self.n
+        self.ys[:n] += self.vys[:n] * np.float32(dt)
+        # drop bullets once their bottom edge is past the top of the screen
+        self.keep(self.ys[:n] + BULLET_SIZE[1] / 2 >= -20)
+
+    def rects(self):
+        w, h = BULLET_SIZE
+        n = self.n
+        return [pygame.Rect(x - w // 2, y - h // 2, w, h)
+                for x, y in zip(self.xs[:n].astype(np.int32).tolist(), self.ys[:n].astype(np.int32).tolist())]
+
+    def blit_items(self):
+        image = self.image
+        return [(image, rect) for rect in self.rects()]
 
 
 class Enemy(pygame.sprite.Sprite):
+    _BASE = None  # every enemy looks the same, so the image is shared
+
     def __init__(self, pos, speed):
         super().__init__()
-        self.base_image = self.make_image()
+        if Enemy._BASE is None:
+            Enemy._BASE = Enemy.make_image()
+        self.base_image = Enemy._BASE
         self.image = self.base_image
         self.rect = self.image.get_rect(center=pos)
+        self.radius = min(ENEMY_SIZE) // 2  # for collide_circle
         self.pos = Vector2(pos)
         self.speed = speed
         # slight oscillation for a bit of personality
         self.phase = random.random() * math.pi * 2
         self.osc_amp = random.uniform(8, 26)
 
-    def make_image(self):
+    @staticmethod
+    def make_image():
         surf = pygame.Surface(ENEMY_SIZE, pygame.SRCALPHA)
         w, h = ENEMY_SIZE
         pygame.draw.ellipse(surf, PALETTE["enemy"], (0, 0, w, h))
         # stylized "mouth" or stripe
         pygame.draw.arc(surf, PALETTE["enemy_shade"], (w * 0.12, h * 0.25, w * 0.76, h * 0.6), math.radians(200), math.radians(340), 4)
-        return surf
+        return surf.convert_alpha()
 
     def update(self, dt):
         # Move down, with horizontal wobble
-        self.phase += dt * 4.0
-        wobble = math.sin(self.phase) * self.osc_amp
+        self.phase += dt * ENEMY_WOBBLE_SPEED
+        wobble = fast_sin(self.phase) * self.osc_amp
         self.pos += Vector2(wobble * dt, self.speed * dt)
         self.rect.center = self.pos
         if self.rect.top > HEIGHT + 40:
             self.kill()
 
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, pos):
-        super().__init__()
-        self.pos = Vector2(pos)
-        angle = random.random() * math.tau
-        speed = random.random() * PARTICLE_SPEED
-        self.vel = Vector2(math.cos(angle), math.sin(angle)) * speed
-        self.lifetime = random.uniform(PARTICLE_LIFETIME * 0.6, PARTICLE_LIFETIME)
-        self.age = 0.0
-        size = random.randint(2, 6)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, PALETTE["particle"], (size // 2, size // 2), size // 2)
-        self.rect = self.image.get_rect(center=self.pos)
+def make_particle_image(size, alpha):
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*PALETTE["particle"], alpha), (size // 2, size // 2), size // 2)
+    return surf.convert_alpha()
+
+
+# PARTICLE_FRAMES[size][bucket] -> circle pre-baked at a quantized alpha,
+# so fading a particle is a lookup instead of Surface.set_alpha
+PARTICLE_FRAMES = {size: [make_particle_image(size, 255 * (bucket + 1) // PARTICLE_ALPHA_LEVELS)
+                          for bucket in range(PARTICLE_ALPHA_LEVELS)]
+                   for size in range(2, 7)}
+
+
+@njit(fastmath=True, cache=True)
+def update_particles(pos, vel, age, life, bucket, dt):
+    age += dt
+    # simple physics + gentle drag
+    pos += vel * dt
+    vel *= 0.98
+    # fade: pick the alpha bucket from the remaining lifetime
+    fade = np.maximum((1.0 - age / life) * PARTICLE_ALPHA_LEVELS, 0.0)
+    bucket[:] = np.minimum(fade, PARTICLE_ALPHA_LEVELS - 1).astype(np.int32)
+
+
+class ParticleSystem(ArrayPool):
+    """Explosion particles stored as parallel arrays (one row per particle)."""
+
+    def __init__(self, capacity=PARTICLE_COUNT * 16):
+        super().__init__(capacity,
+                         pos=((2,), np.float32), vel=((2,), np.float32),
+                         age=((), np.float32), life=((), np.float32),
+                         size=((), np.int32), bucket=((), np.int32))
+        # compile the kernel now rather than on the first explosion mid-game
+        update_particles(self.pos[:0], self.vel[:0], self.age[:0], self.life[:0], self.bucket[:0], np.float32(0))
+
+    def spawn(self, pos, count=PARTICLE_COUNT):
+        rows = self.acquire(count)
+        angle = np.random.uniform(0, math.tau, count)
+        speed = np.random.uniform(0, PARTICLE_SPEED, count)
+        self.pos[rows] = pos
+        self.vel[rows, 0] = np.cos(angle) * speed
+        self.vel[rows, 1] = np.sin(angle) * speed
+        self.age[rows] = 0.0
+        self.life[rows] = np.random.uniform(PARTICLE_LIFETIME * 0.6, PARTICLE_LIFETIME, count)
+        self.size[rows] = np.random.randint(2, 7, count)
+        self.bucket[rows] = PARTICLE_ALPHA_LEVELS - 1
 
     def update(self, dt):
-        self.age += dt
-        if self.age >= self.lifetime:
-            self.kill()
+        n = self.n
+        if not n:
             return
-        # simple physics + fade
-        self.pos += self.vel * dt
-        self.vel *= 0.98  # gentle drag
-        alpha = int(255 * (1.0 - (self.age / self.lifetime)))
-        self.image.set_alpha(alpha)
-        self.rect.center = self.pos
+        update_particles(self.pos[:n], self.vel[:n], self.age[:n], self.life[:n], self.bucket[:n], np.float32(dt))
+        self.keep(self.age[:n] < self.life[:n])
+
+    def blit_items(self):
+        """(image, position) pairs ready for Surface.blit / Surface.blits."""
+        n = self.n
+        size = self.size[:n]
+        half = size // 2
+        xs = (self.pos[:n, 0] - half).astype(np.int32)
+        ys = (self.pos[:n, 1] - half).astype(np.int32)
+        frames = PARTICLE_FRAMES
+        return [(frames[size][bucket], (x, y))
+                for size, bucket, x, y in zip(size.tolist(), self.bucket[:n].tolist(), xs.tolist(), ys.tolist())]
 
 
 # ---------- Starfield for parallax ----------
-class Star:
-    def __init__(self, x, y, size, layer):
-        self.pos = Vector2(x, y)
-        self.size = size
-        self.layer = layer  # 0 = near (fast), 2 = far (slow)
-        self.base_x = x
+class Starfield:
+    """All stars stored as parallel arrays so update/draw are vectorized."""
+
+    def __init__(self, count):
+        # 0 = near (fast), 2 = far (slow)
+        self.layers = np.random.choice([0, 1, 2], size=count, p=[0.2, 0.4, 0.4])
+        self.xs = np.random.uniform(0, WIDTH, count)
+        self.ys = np.random.uniform(0, HEIGHT, count)
+        self.sizes = np.where(self.layers > 0,
+                              np.random.randint(1, 4, count),
+                              np.random.randint(2, 5, count))
+        self.speeds = 20 + self.layers * 40
+        # layers and sizes never change: 1px stars are poked straight into the
+        # pixel buffer, the rest are drawn as circles far to near
+        self.pixel_idx = np.flatnonzero(self.sizes == 1)
+        self.circle_idx = [np.flatnonzero((self.layers == layer) & (self.sizes > 1)) for layer in (2, 1, 0)]
 
     def update(self, dt, speed_factor):
         # drift downward slightly and loop
-        self.pos.y += (20 + self.layer * 40) * dt * speed_factor
-        if self.pos.y > HEIGHT + 10:
-            self.pos.y = -10
-            self.pos.x = random.uniform(0, WIDTH)
+        self.ys += self.speeds * (dt * speed_factor)
+        wrap = self.ys > HEIGHT + 10
+        if wrap.any():
+            self.ys[wrap] = -10
+            self.xs[wrap] = np.random.uniform(0, WIDTH, wrap.sum())
 
     def draw(self, surf):
-        if self.layer == 0:
-            # bright rough star
-            pygame.draw.circle(surf, PALETTE["star2"], (int(self.pos.x), int(self.pos.y)), max(1, self.size))
-        else:
-            pygame.draw.circle(surf, PALETTE["star1"], (int(self.pos.x), int(self.pos.y)), max(1, self.size))
+        """Draw all stars and return the list of rects that were touched."""
+        xs = self.xs[self.pixel_idx].astype(int)
+        ys = self.ys[self.pixel_idx].astype(int)
+        visible = (xs >= 0) & (xs < WIDTH) & (ys >= 0) & (ys < HEIGHT)
+        xs, ys = xs[visible], ys[visible]
+        pixels = pygame.surfarray.pixels3d(surf)
+        pixels[xs, ys] = PALETTE["star1"]
+        del pixels  # unlock the surface before drawing circles
+        dirty = [(x, y, 1, 1) for x, y in zip(xs.tolist(), ys.tolist())]
+
+        for idx in self.circle_idx:
+            for x, y, size, layer in zip(self.xs[idx].astype(int).tolist(), self.ys[idx].astype(int).tolist(),
+                                         self.sizes[idx].tolist(), self.layers[idx].tolist()):
+                # near layer gets the brighter star color
+                color = PALETTE["star2"] if layer == 0 else PALETTE["star1"]
+                dirty.append(pygame.draw.circle(surf, color, (x, y), size))
+        return dirty
 
 
 def create_starfield(count=120):
-    stars = []
-    for _ in range(count):
-        x = random.uniform(0, WIDTH)
-        y = random.uniform(0, HEIGHT)
-        layer = random.choices([0, 1, 2], weights=[0.2, 0.4, 0.4])[0]
-        size = random.randint(1, 3) if layer > 0 else random.randint(2, 4)
-        stars.append(Star(x, y, size, layer))
-    return stars
+    return Starfield(count)
+
+
+# ---------- Collision ----------
+class SpatialHash:
+    """Uniform grid of sprites keyed by the cell their center falls in."""
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, sprites):
+        self.cells.clear()
+        cs = self.cell_size
+        for sprite in sprites:
+            key = (sprite.rect.centerx // cs, sprite.rect.centery // cs)
+            self.cells.setdefault(key, []).append(sprite)
+
+    def query(self, rect):
+        """Yield sprites whose center is in the cell of rect or one of its 8 neighbors."""
+        cx = rect.centerx // self.cell_size
+        cy = rect.centery // self.cell_size
+        cells = self.cells
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                yield from cells.get((cx + dx, cy + dy), ())
+
+
+def collide_bullets(grid, bullets):
+    """Like groupcollide(enemies, bullets, True, True) but only testing nearby enemies.
+
+    Returns {enemy: [bullet indices]}; hit enemies are killed and hit bullets removed.
+    """
+    hits = {}
+    dead = []
+    for i, rect in enumerate(bullets.rects()):
+        for enemy in grid.query(rect):
+            if rect.colliderect(enemy.rect):
+                hits.setdefault(enemy, []).append(i)
+                dead.append(i)
+                break
+    for enemy in hits:
+        enemy.kill()
+    if dead:
+        bullets.release(dead)
+    return hits
 
 
 # ---------- Game Manager ----------
@@ -248,29 +488,31 @@ def spawn_enemy(group):
     return e
 
 
-def spawn_explosion(pos, particle_group):
-    for _ in range(PARTICLE_COUNT):
-        p = Particle(pos)
-        particle_group.add(p)
+def spawn_explosion(pos, particles):
+    particles.spawn(pos, PARTICLE_COUNT)
 
 
 def draw_hud(surf, player):
+    """Draw score, lives and the controls hint; returns the rects drawn."""
     # score and lives
     score_surf = font.render(f"Score: {player.score}", True, PALETTE["ui"])
     lives_surf = font.render(f"Lives: {player.lives}", True, PALETTE["ui"])
-    surf.blit(score_surf, (12, 12))
-    surf.blit(lives_surf, (WIDTH - lives_surf.get_width() - 12, 12))
     # hint
     hint = font.render("Move: Arrows / WASD    Shoot: Space", True, PALETTE["ui"])
-    surf.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 30))
+    return surf.blits([
+        (score_surf, (12, 12)),
+        (lives_surf, (WIDTH - lives_surf.get_width() - 12, 12)),
+        (hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 30)),
+    ])
 
 
 def main():
     # sprite groups
     player_group = pygame.sprite.GroupSingle()
-    bullet_group = pygame.sprite.Group()
+    bullets = BulletPool()
     enemy_group = pygame.sprite.Group()
-    particle_group = pygame.sprite.Group()
+    particles = ParticleSystem()
+    grid = SpatialHash()
 
     player = Player((WIDTH // 2, HEIGHT - 100))
     player_group.add(player)
@@ -284,17 +526,25 @@ def main():
 
     # subtle background gradient surface
     bg_surf = pygame.Surface((WIDTH, HEIGHT))
-    for y in range(HEIGHT):
-        # interpolation between two bg colors
-        t = y / HEIGHT
-        r = int(PALETTE["bg_dark"][0] * (1 - t) + PALETTE["bg_soft"][0] * t)
-        g = int(PALETTE["bg_dark"][1] * (1 - t) + PALETTE["bg_soft"][1] * t)
-        b = int(PALETTE["bg_dark"][2] * (1 - t) + PALETTE["bg_soft"][2] * t)
-        pygame.draw.line(bg_surf, (r, g, b), (0, y), (WIDTH, y))
+    gradient = make_gradient(HEIGHT, WIDTH, PALETTE["bg_dark"], PALETTE["bg_soft"])
+    # pygame expects (width, height, 3)
+    pygame.surfarray.blit_array(bg_surf, gradient.swapaxes(0, 1))
+    bg_surf = bg_surf.convert()
+
+    # small additive glow behind player (static, so built once)
+    glow_surf = pygame.Surface((PLAYER_SIZE[0] * 2, PLAYER_SIZE[1] * 2), pygame.SRCALPHA)
+    gx, gy = glow_surf.get_size()
+    pygame.draw.ellipse(glow_surf, (PALETTE["player"][0], PALETTE["player"][1], PALETTE["player"][2], 40), (0, 0, gx, gy))
+    glow_surf = glow_surf.convert_alpha()
+
+    # screen regions drawn last frame; the whole screen so the first frame is a full paint
+    prev_dirty = [screen.get_rect()]
 
     # main loop
     while running:
-        dt = clock.tick(FPS) / 1000.0  # seconds passed since last frame
+        # nothing is visible while minimized: keep simulating but at a lower rate
+        visible = pygame.display.get_active()
+        dt = clock.tick(FPS if visible else IDLE_FPS) / 1000.0  # seconds passed since last frame
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -304,13 +554,13 @@ def main():
                 if event.key == pygame.K_p:
                     paused = not paused
 
-        keys = pygame.key.get_pressed()
+        controls = read_controls()
 
         if not paused:
             # update starfield speed factor from player horizontal input
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            if controls.left:
                 speed_factor = 0.75
-            elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            elif controls.right:
                 speed_factor = 1.25
             else:
                 # gently return to neutral
@@ -324,73 +574,72 @@ def main():
                 spawn_enemy(enemy_group)
 
             # player update
-            player.update(dt, keys)
+            player.update(dt, controls)
 
             # shooting
-            if (keys[pygame.K_SPACE] or keys[pygame.K_z]) and player.can_shoot():
+            if controls.fire and player.can_shoot():
                 # create two bullets for a little spread
-                b1 = Bullet(player.rect.midtop - Vector2(10, 0))
-                b2 = Bullet(player.rect.midtop + Vector2(10, 0))
-                bullet_group.add(b1, b2)
+                bullets.spawn(player.rect.midtop - Vector2(10, 0))
+                bullets.spawn(player.rect.midtop + Vector2(10, 0))
                 player.shoot()
 
             # update bullets, enemies, particles
-            bullet_group.update(dt)
+            bullets.update(dt)
             enemy_group.update(dt)
-            particle_group.update(dt)
+            particles.update(dt)
 
             # update stars
-            for s in stars:
-                s.update(dt, speed_factor)
+            stars.update(dt, speed_factor)
 
             # collisions: bullets -> enemies
-            hits = pygame.sprite.groupcollide(enemy_group, bullet_group, True, True)
+            grid.rebuild(enemy_group)
+            hits = collide_bullets(grid, bullets)
             for enemy in hits:
                 player.score += 10
                 # explosion particles
-                spawn_explosion(enemy.rect.center, particle_group)
+                spawn_explosion(enemy.rect.center, particles)
 
             # collisions: enemies -> player
-            if pygame.sprite.spritecollide(player, enemy_group, True, pygame.sprite.collide_mask if False else pygame.sprite.collide_rect):
+            if pygame.sprite.spritecollide(player, enemy_group, True, pygame.sprite.collide_circle):
                 player.lives -= 1
-                spawn_explosion(player.rect.center, particle_group)
+                spawn_explosion(player.rect.center, particles)
                 if player.lives <= 0:
                     # Game over: reset score and lives, clear enemies but keep running
                     # a bit of a soft reset with a small flash
-                    spawn_explosion(player.rect.center, particle_group)
+                    spawn_explosion(player.rect.center, particles)
                     player.lives = 3
                     player.score = 0
                     for e in enemy_group:
-                        spawn_explosion(e.rect.center, particle_group)
+                        spawn_explosion(e.rect.center, particles)
                     enemy_group.empty()
-                    bullet_group.empty()
+                    bullets.clear()
+
+        if not visible:
+            # the window contents may be lost, repaint everything once shown again
+            prev_dirty = [screen.get_rect()]
+            continue
 
         # --- Drawing ---
-        screen.blit(bg_surf, (0, 0))
+        # only what was drawn last frame needs erasing, the rest is still background
+        screen.blits([(bg_surf, r, r) for r in prev_dirty], doreturn=False)
 
         # draw stars in layers for depth (far to near)
-        for layer in (2, 1, 0):
-            for s in [x for x in stars if x.layer == layer]:
-                s.draw(screen)
+        dirty = stars.draw(screen)
 
         # small additive glow behind player
-        glow = pygame.Surface((player.rect.width * 2, player.rect.height * 2), pygame.SRCALPHA)
-        gx, gy = glow.get_size()
-        pygame.draw.ellipse(glow, (PALETTE["player"][0], PALETTE["player"][1], PALETTE["player"][2], 40), (0, 0, gx, gy))
-        screen.blit(glow, (player.rect.centerx - gx // 2, player.rect.centery - gy // 2 + 10), special_flags=pygame.BLEND_ADD)
-
-        # draw sprites
-        for sprite in enemy_group:
-            screen.blit(sprite.image, sprite.rect)
-        for sprite in bullet_group:
-            screen.blit(sprite.image, sprite.rect)
-        for sprite in particle_group:
-            screen.blit(sprite.image, sprite.rect)
-        for sprite in player_group:
-            screen.blit(sprite.image, sprite.rect)
+        dirty.append(screen.blit(glow_surf, (player.rect.centerx - gx // 2, player.rect.centery - gy // 2 + 10),
+                                 special_flags=pygame.BLEND_ADD))
+
+        # draw sprites in one batched call (enemies, bullets, particles, player)
+        dirty += screen.blits(chain(
+            ((sprite.image, sprite.rect) for sprite in enemy_group),
+            bullets.blit_items(),
+            particles.blit_items(),
+            ((sprite.image, sprite.rect) for sprite in player_group),
+        ))
 
         # HUD
-        draw_hud(screen, player)
+        dirty += draw_hud(screen, player)
 
         # pause overlay
         if paused:
@@ -399,8 +648,11 @@ def main():
             screen.blit(overlay, (0, 0))
             text = font.render("PAUSED - Press P to resume", True, PALETTE["ui"])
             screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - text.get_height() // 2))
+            dirty = [screen.get_rect()]
 
-        pygame.display.flip()
+        # push both the erased and the newly drawn regions to the display
+        pygame.display.update(prev_dirty + dirty)
+        prev_dirty = dirty
 
     pygame.quit()
     sys.exit()
@@ -1,3 +1,57 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .models import Post
+from .views import POSTS_PER_PAGE
+
+
+class PostListViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user(username='alice', password='secret')
+        Post.objects.bulk_create(
+            Post(title=f'Post {i}', author=cls.author, content='Some words ' * 50)
+            for i in range(POSTS_PER_PAGE * 2 + 5)
+        )
+
+    def test_first_page(self):
+        # one COUNT for the paginator and one SELECT joined with the author
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('post_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['posts']), POSTS_PER_PAGE)
+        self.assertContains(response, 'Page 1 of 3')
+        self.assertContains(response, 'By alice')
+
+    def test_last_page(self):
+        response = self.client.get(reverse('post_list'), {'page': 3})
+        self.assertEqual(len(response.context['posts']), 5)
+        self.assertContains(response, 'Page 3 of 3')
+
+    def test_invalid_page_falls_back_to_first(self):
+        response = self.client.get(reverse('post_list'), {'page': 'abc'})
+        self.assertContains(response, 'Page 1 of 3')
+
+    def test_out_of_range_page_shows_last(self):
+        response = self.client.get(reverse('post_list'), {'page': 99})
+        self.assertContains(response, 'Page 3 of 3')
+
+
+class PostDetailViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user(username='alice', password='secret')
+        cls.post = Post.objects.create(title='Hello', author=author, content='Full post body')
+
+    def test_single_query(self):
+        # the author is joined in, so rendering post.author must not query again
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('post_detail', args=[self.post.pk]))
+        self.assertContains(response, 'Hello')
+        self.assertContains(response, 'Full post body')
+        self.assertContains(response, 'By alice')
+
+    def test_missing_post_404(self):
+        response = self.client.get(reverse('post_detail', args=[self.post.pk + 1]))
+        self.assertEqual(response.status_code, 404)
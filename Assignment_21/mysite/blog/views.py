@@ -1,3 +1,4 @@
+from django.core.paginator import Paginator
 from django.shortcuts import render, get_object_or_404
 from .models import Post
 from django.shortcuts import render, redirect
@@ -5,12 +6,22 @@ from .models import Post
 from .forms import PostForm
 from django.contrib.auth.decorators import login_required
 
+POSTS_PER_PAGE = 20
+
 def post_list(request):
-    posts = Post.objects.order_by('-created_at')
-    return render(request, 'blog/post_list.html', {'posts': posts})
+    # join the author in the same query and skip the unused User columns
+    posts = (Post.objects
+             .select_related('author')
+             .only('title', 'content', 'created_at', 'author__username')
+             .order_by('-created_at', '-pk'))  # pk keeps pages stable on equal timestamps
+    page_obj = Paginator(posts, POSTS_PER_PAGE).get_page(request.GET.get('page'))
+    return render(request, 'blog/post_list.html', {'posts': page_obj, 'page_obj': page_obj})
 
 def post_detail(request, pk):
-    post = get_object_or_404(Post, pk=pk)
+    post = get_object_or_404(
+        Post.objects.select_related('author').only('title', 'content', 'created_at', 'author__username'),
+        pk=pk,
+    )
     return render(request, 'blog/post_detail.html', {'post': post})
 
 @login_required